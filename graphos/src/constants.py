@@ -13,6 +13,7 @@ class Ascii:
     ROUND_UR_CORNER = "╮"
     ROUND_LL_CORNER = "╰"
     ROUND_LR_CORNER = "╯"
+    HORIZONTAL_LINE = "─"
 
 
 MOUSE_OUTPUT = "logging/mouse.log"
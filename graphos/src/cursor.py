@@ -6,7 +6,7 @@ Contains the Cursor class which defines how the coordinates of position in termi
 
 from curses import window
 
-from graphos.src.utils import get_safe_x, get_safe_y
+from graphos.src.utils import get_safe_xy
 from graphos.src.offset import Offset
 
 
@@ -21,6 +21,8 @@ class Cursor:
         grab_symbol: visual representation for when grabbing objects
     """
 
+    __slots__ = ("x", "y", "grab", "color", "args", "symbol", "grab_symbol")
+
     def __init__(self, x: int, y: int, args: dict[str:str]) -> None:
         self.x = x
         self.y = y
@@ -42,13 +44,10 @@ class Cursor:
 
         """
 
-        normalized_x = self.x
-        normalized_y = self.y
+        max_y, max_x = stdscr.getmaxyx()
 
-        if normalized_x >= stdscr.getmaxyx()[1]:
-            self.x = stdscr.getmaxyx()[1] - 2
-        if normalized_y >= stdscr.getmaxyx()[0]:
-            self.y = stdscr.getmaxyx()[0] - 2
+        self.x = self.x if self.x < max_x else max_x - 2
+        self.y = self.y if self.y < max_y else max_y - 2
 
     def toggle_grab(self) -> None:
         """Toggles current grab setting"""
@@ -56,14 +55,14 @@ class Cursor:
 
     def render(self, stdscr: window, offset: Offset) -> None:
         """Displays the cursor based on current set locations
+        The cursor is stored in screen coordinates, so it is placed relative to
+        where the provided window begins on screen.
 
         Args:
             stdscr: curses.window object for current screen size
             offset: Offset calculator for rendering
         """
         symbol = self.grab_symbol if self.grab else self.symbol
-        stdscr.addstr(
-            get_safe_y(stdscr, self.y),
-            get_safe_x(stdscr, self.x),
-            symbol,
-        )
+        begin_y, begin_x = stdscr.getbegyx()
+        x, y = get_safe_xy(stdscr, self.x - begin_x, self.y - begin_y)
+        stdscr.addstr(y, x, symbol)
@@ -6,31 +6,22 @@ Intended to be used to convey a relationship between objects
 """
 
 import curses
-from dataclasses import dataclass
 from typing import Any, Tuple
 import uuid
 
 from graphos.src.node import Node
 from graphos.src.offset import Offset
-from graphos.src.utils import get_safe_x, get_safe_y
 
+# Line segment types, corners use their curses ACS int as the type instead
+_SEG_V, _SEG_H = 0, 1
 
-@dataclass
-class LineSegment:
-    """
-    Represents a line segment in the graph.
+# A line segment in the graph, stored as (type, x, y, length).
+# type is _SEG_V, _SEG_H or a curses ACS corner int.
+LineSegment = Tuple[int, int, int, int]
 
-    Attributes:
-        type: str type of line segment
-        x: int x coordinate
-        y: int y coordinate
-        length: int length of line
-    """
-
-    type: str
-    x: int
-    y: int
-    length: int = 0
+# The parts of a Node needed to connect it, stored as
+# (center_x, center_y, width, height).
+NodeGeometry = Tuple[int, int, int, int]
 
 
 class Edge:
@@ -43,73 +34,39 @@ class Edge:
         edge_id: unique identifier for Edge, defaults to uuid
     """
 
+    __slots__ = ("source", "target", "id", "_cache_key", "_cache_lines")
+
     def __init__(self, source: Node, target: Node, edge_id: str = None) -> None:
         self.source = source
         self.target = target
 
         self.id = edge_id if edge_id else str(uuid.uuid4())
 
+        # Geometry of both nodes when the line segments were last computed
+        self._cache_key = None
+        self._cache_lines = None
+
     def __str__(self) -> str:
         """To string definition for Edge"""
         return f"Edge({self.source}, {self.target})"
 
-    def _determine_relative_nodes(self) -> Tuple[Node, Node, Node, Node]:
+    def _determine_relative_nodes(self) -> Tuple[bool, bool]:
         """
         Determines the relative positions of nodes based on horizontal
         and vertical locations.
 
         Returns:
-            Tuple of Node objects left, right, top and bottom locations
-        """
-        node_1, node_2 = self.source, self.target
-        left_node = node_1 if node_1.x < node_2.x else node_2
-        right_node = node_2 if node_1.x < node_2.x else node_1
-        top_node = node_1 if node_1.y < node_2.y else node_2
-        bottom_node = node_2 if node_1.y < node_2.y else node_1
-        return left_node, right_node, top_node, bottom_node
-
-    def _determine_corner_types(
-        self, top_node: Node, bottom_node: Node
-    ) -> Tuple[int | None, int | None]:
+            Tuple of bools, whether the source is the left node and whether
+            the source is the top node
         """
-        Determines the type of corners needed for lines.
-
-        Args:
-            top_node: Node that is higher vertically
-            bottom_node: Node that is lower in pair
-
-        Returns:
-            Tuple of ASCII ints/None
-        """
-        top_corner = None
-        bottom_corner = None
-        if top_node.center_x > bottom_node.center_x:
-            top_corner = curses.ACS_LRCORNER
-            bottom_corner = curses.ACS_ULCORNER
-        elif top_node.center_x < bottom_node.center_x:
-            top_corner = curses.ACS_LLCORNER
-            bottom_corner = curses.ACS_URCORNER
-        return top_corner, bottom_corner
-
-    def _has_vertical_bias(self, x_diff: int, y_diff: int) -> bool:
-        """
-        Determine whether the connection should have a vertical or horizontal bias.
-
-        Args:
-            x_diff: Horizontal distance between nodes
-            y_diff: Vertical distance between nodes
-
-        Returns:
-            bool statement if vertical_bias is present
-        """
-        return x_diff == 0 or x_diff <= y_diff
+        return self.source.x < self.target.x, self.source.y < self.target.y
 
     def _create_vertical_connection(
         self,
-        left_node: Node,
-        right_node: Node,
-        top_node: Node,
-        bottom_node: Node,
+        left: NodeGeometry,
+        right: NodeGeometry,
+        top: NodeGeometry,
+        bottom: NodeGeometry,
         x_diff: int,
         y_diff: int,
     ) -> list[LineSegment]:
@@ -117,87 +74,76 @@ class Edge:
         Create line segments for a vertically biased connection.
 
         Args:
-            left_node: Node on the left
-            right_node: Node on the right
-            top_node: Node on the top
-            bottom_node: Node on the bottom
+            left: NodeGeometry of the Node on the left
+            right: NodeGeometry of the Node on the right
+            top: NodeGeometry of the Node on the top
+            bottom: NodeGeometry of the Node on the bottom
             x_diff: Horizontal distance between nodes
             y_diff: Vertical distance between nodes
 
         Returns:
-            List of LineSegment objects representing the connection
+            List of LineSegment tuples representing the connection
         """
+        left_x = left[0]
+        right_x = right[0]
+        top_x, top_y, _, top_height = top
+        bottom_x, bottom_y, _, bottom_height = bottom
         lines = []
 
-        # Divide the vertical line into two segments
-        y_diff_1 = y_diff // 2
+        # Divide the vertical line into two segments, y_diff is never negative
+        y_diff_1 = y_diff >> 1
         y_diff_2 = y_diff - y_diff_1
 
         # Adjust the y-coordinates to account for the node heights
-        y_diff_1 -= top_node.height // 2
-        y_diff_2 -= bottom_node.height // 2
+        y_diff_1 -= top_height // 2
+        y_diff_2 -= bottom_height // 2
 
-        top_corner, bottom_corner = self._determine_corner_types(top_node, bottom_node)
+        # Determine corner types needed for lines
+        top_corner = None
+        bottom_corner = None
+        if top_x > bottom_x:
+            top_corner = curses.ACS_LRCORNER
+            bottom_corner = curses.ACS_ULCORNER
+        elif top_x < bottom_x:
+            top_corner = curses.ACS_LLCORNER
+            bottom_corner = curses.ACS_URCORNER
 
         # Calculate horizontal line position
-        h_line_x = (
-            left_node.center_x
-            if left_node.center_x < right_node.center_x
-            else right_node.center_x + 1
-        )
-        h_line_y = bottom_node.center_y - y_diff_2 - bottom_node.height // 2
+        h_line_x = left_x if left_x < right_x else right_x + 1
+        h_line_y = bottom_y - y_diff_2 - bottom_height // 2
 
         # Add horizontal line segment
-        lines.append(
-            LineSegment(type="horizontal", x=h_line_x, y=h_line_y, length=x_diff)
-        )
+        lines.append((_SEG_H, h_line_x, h_line_y, x_diff))
 
         # Add corner segments if needed
         if top_corner and bottom_corner:
-            lines.append(
-                LineSegment(
-                    type=top_corner,
-                    x=top_node.center_x,
-                    y=top_node.center_y + top_node.height // 2 + y_diff_1,
-                )
-            )
+            lines.append((top_corner, top_x, top_y + top_height // 2 + y_diff_1, 0))
             y_diff_1 -= 1
             y_diff_2 -= 1
             lines.append(
-                LineSegment(
-                    type=bottom_corner,
-                    x=bottom_node.center_x,
-                    y=bottom_node.center_y - y_diff_2 - bottom_node.height // 2 - 1,
+                (
+                    bottom_corner,
+                    bottom_x,
+                    bottom_y - y_diff_2 - bottom_height // 2 - 1,
+                    0,
                 )
             )
 
         # Add vertical line segments
-        lines.append(
-            LineSegment(
-                type="vertical",
-                x=top_node.center_x,
-                y=top_node.center_y + top_node.height // 2 + 1,
-                length=y_diff_1,
-            )
-        )
+        lines.append((_SEG_V, top_x, top_y + top_height // 2 + 1, y_diff_1))
 
         lines.append(
-            LineSegment(
-                type="vertical",
-                x=bottom_node.center_x,
-                y=bottom_node.center_y - y_diff_2 - bottom_node.height // 2,
-                length=y_diff_2,
-            )
+            (_SEG_V, bottom_x, bottom_y - y_diff_2 - bottom_height // 2, y_diff_2)
         )
 
         return lines
 
     def _create_horizontal_connection(
         self,
-        left_node: Node,
-        right_node: Node,
-        top_node: Node,
-        bottom_node: Node,
+        left: NodeGeometry,
+        right: NodeGeometry,
+        top: NodeGeometry,
+        bottom: NodeGeometry,
         x_diff: int,
         y_diff: int,
     ) -> list[LineSegment]:
@@ -205,221 +151,142 @@ class Edge:
         Create line segments for a horizontally biased connection.
 
         Args:
-            left_node: Node on the left
-            right_node: Node on the right
-            top_node: Node on the top
-            bottom_node: Node on the bottom
+            left: NodeGeometry of the Node on the left
+            right: NodeGeometry of the Node on the right
+            top: NodeGeometry of the Node on the top
+            bottom: NodeGeometry of the Node on the bottom
             x_diff: Horizontal distance between nodes
             y_diff: Vertical distance between nodes
 
         Returns:
-            List of LineSegment objects representing the connection
+            List of LineSegment tuples representing the connection
         """
+        left_x, left_y, left_width, _ = left
+        right_x, right_y, right_width, _ = right
+        top_y = top[1]
+        bottom_y = bottom[1]
         lines = []
 
-        # Divide the horizontal line into two segments
-        x_diff_1 = x_diff // 2
+        # Divide the horizontal line into two segments, x_diff is never negative
+        x_diff_1 = x_diff >> 1
         x_diff_2 = x_diff - x_diff_1
 
         # Adjust the x-coordinates to account for the node widths
-        x_diff_1 -= left_node.width // 2
-        x_diff_2 -= right_node.width // 2
+        x_diff_1 -= left_width // 2
+        x_diff_2 -= right_width // 2
 
         # Add first horizontal line segment
-        lines.append(
-            LineSegment(
-                type="horizontal",
-                x=left_node.center_x + left_node.width // 2,
-                y=left_node.center_y,
-                length=x_diff_1,
-            )
-        )
+        lines.append((_SEG_H, left_x + left_width // 2, left_y, x_diff_1))
 
         # Determine corner types for horizontal connection
-        left_corner, right_corner = self._determine_horizontal_corner_types(
-            left_node, right_node
-        )
+        left_corner = None
+        right_corner = None
+        if left_y > right_y:
+            left_corner = curses.ACS_LRCORNER
+            right_corner = curses.ACS_ULCORNER
+        elif left_y < right_y:
+            left_corner = curses.ACS_URCORNER
+            right_corner = curses.ACS_LLCORNER
 
         # Calculate vertical line position
-        v_line_x = right_node.center_x - x_diff_2 - right_node.width // 2
-        v_line_y = (
-            bottom_node.center_y
-            if bottom_node.center_y < top_node.center_y
-            else top_node.center_y + 1
-        )
+        v_line_x = right_x - x_diff_2 - right_width // 2
+        v_line_y = bottom_y if bottom_y < top_y else top_y + 1
 
         # Add vertical line segment
-        lines.append(
-            LineSegment(
-                type="vertical",
-                x=v_line_x,
-                y=v_line_y,
-                length=abs(v_line_y + y_diff - v_line_y),
-            )
-        )
+        lines.append((_SEG_V, v_line_x, v_line_y, y_diff))
 
         # Add corner segments if needed
         if left_corner and right_corner:
             x_diff_2 -= 1
+            lines.append((left_corner, left_x + left_width // 2 + x_diff_1, left_y, 0))
             lines.append(
-                LineSegment(
-                    type=left_corner,
-                    x=left_node.center_x + left_node.width // 2 + x_diff_1,
-                    y=left_node.center_y,
-                )
-            )
-            lines.append(
-                LineSegment(
-                    type=right_corner,
-                    x=right_node.center_x - x_diff_2 - right_node.width // 2 - 1,
-                    y=right_node.center_y,
-                )
+                (right_corner, right_x - x_diff_2 - right_width // 2 - 1, right_y, 0)
             )
 
         # Add second horizontal line segment
-        lines.append(
-            LineSegment(
-                type="horizontal",
-                x=right_node.center_x - x_diff_2 - right_node.width // 2,
-                y=right_node.center_y,
-                length=x_diff_2,
-            )
-        )
+        lines.append((_SEG_H, right_x - x_diff_2 - right_width // 2, right_y, x_diff_2))
 
         return lines
 
-    def _determine_horizontal_corner_types(
-        self, left_node: Node, right_node: Node
-    ) -> Tuple[int | None, int | None]:
-        """
-        Determines the type of corners needed for horizontal lines.
-
-        Args:
-            left_node: Node that is on the left
-            right_node: Node that is on the right
-
-        Returns:
-            Tuple of ASCII ints for left and right corners
-        """
-        left_corner = None
-        right_corner = None
-        if left_node.center_y > right_node.center_y:
-            left_corner = curses.ACS_LRCORNER
-            right_corner = curses.ACS_ULCORNER
-        elif left_node.center_y < right_node.center_y:
-            left_corner = curses.ACS_URCORNER
-            right_corner = curses.ACS_LLCORNER
-        return left_corner, right_corner
-
-    def _convert_line_segments_to_dict(
-        self, lines: list[LineSegment]
-    ) -> list[dict[str, Any]]:
-        """
-        Convert LineSegment objects to dictionary format for rendering.
-
-        Args:
-            lines: List of LineSegment objects
-
-        Returns:
-            List of dictionaries representing line segments
-        """
-        return [
-            {"type": line.type, "x": line.x, "y": line.y, "length": line.length}
-            for line in lines
-        ]
-
-    def get_line_breakdown(self) -> list[dict[str, Any]]:
+    def get_line_breakdown(self) -> list[LineSegment]:
         """
         Calculate the line segments needed to connect two nodes.
 
         This method determines the optimal way to connect nodes with line segments,
-        taking into account their relative positions and sizes.
+        taking into account their relative positions and sizes. The result is
+        cached and reused until either node moves or is resized.
 
         Returns:
-            List of dictionaries representing line segments with their properties
+            List of (type, x, y, length) tuples representing the line segments
         """
+        source, target = self.source, self.target
+        key = (
+            source.x,
+            source.y,
+            source.width,
+            source.height,
+            target.x,
+            target.y,
+            target.width,
+            target.height,
+        )
+        if key == self._cache_key:
+            return self._cache_lines
+
+        # Read node geometry once, the connection builders only use these values
+        source_geometry = (
+            source.center_x,
+            source.center_y,
+            source.width,
+            source.height,
+        )
+        target_geometry = (
+            target.center_x,
+            target.center_y,
+            target.width,
+            target.height,
+        )
+
         # Establishes relative node locations (left, right, top, bottom)
-        left_node, right_node, top_node, bottom_node = self._determine_relative_nodes()
+        source_is_left, source_is_top = self._determine_relative_nodes()
+        left, right = (
+            (source_geometry, target_geometry)
+            if source_is_left
+            else (target_geometry, source_geometry)
+        )
+        top, bottom = (
+            (source_geometry, target_geometry)
+            if source_is_top
+            else (target_geometry, source_geometry)
+        )
 
         # Calculate distances between nodes
-        x_diff = abs(right_node.center_x - left_node.center_x)
-        y_diff = abs(bottom_node.center_y - top_node.center_y)
+        x_diff = abs(right[0] - left[0])
+        y_diff = abs(bottom[1] - top[1])
 
         # Determine connection bias (vertical or horizontal)
-        has_vertical_bias = self._has_vertical_bias(x_diff, y_diff)
+        has_vertical_bias = x_diff == 0 or x_diff <= y_diff
 
         # Reset edge indicators on nodes
-        if has_vertical_bias:
-            top_node.reset_edges()
-            bottom_node.reset_edges()
-            # TODO: Fix the fact that deleting the edge doesn't reset the node edge characters
-            # top_node.bottom_edge = True
-            # bottom_node.top_edge = True
-        else:
-            left_node.reset_edges()
-            right_node.reset_edges()
-            # left_node.right_edge = True
-            # right_node.left_edge = True
+        source.reset_edges()
+        target.reset_edges()
+        # TODO: Fix the fact that deleting the edge doesn't reset the node edge characters
+        # vertical bias: top_node.bottom_edge = True, bottom_node.top_edge = True
+        # horizontal bias: left_node.right_edge = True, right_node.left_edge = True
 
         # Create appropriate connection based on bias
         if has_vertical_bias:
             line_segments = self._create_vertical_connection(
-                left_node, right_node, top_node, bottom_node, x_diff, y_diff
+                left, right, top, bottom, x_diff, y_diff
             )
         else:  # horizontal_bias
             line_segments = self._create_horizontal_connection(
-                left_node, right_node, top_node, bottom_node, x_diff, y_diff
+                left, right, top, bottom, x_diff, y_diff
             )
 
-        # Convert LineSegment objects to dictionaries for rendering
-        return self._convert_line_segments_to_dict(line_segments)
-
-    def connect_nodes(self, win: curses.window, offset: Offset) -> None:
-        """
-        Renders terminal updates based on Node calculations.
-
-        Args:
-            win: window to draw in
-            offset: Offset for terminal
-        """
-
-        lines = self.get_line_breakdown()
-
-        for line in lines:
-
-            normalized_x = line["x"] - offset.x
-            normalized_y = line["y"] - offset.y
-
-            diff_deduction_x = abs(get_safe_x(win, normalized_x) - normalized_x)
-            diff_deduction_y = abs(get_safe_y(win, normalized_y) - normalized_y)
-
-            if line["type"] == "vertical":
-                win.vline(
-                    get_safe_y(win, normalized_y),
-                    get_safe_x(win, normalized_x),
-                    curses.ACS_VLINE,
-                    line["length"] - diff_deduction_y,
-                )
-            elif line["type"] == "horizontal":
-                win.hline(
-                    get_safe_y(win, normalized_y),
-                    get_safe_x(win, normalized_x),
-                    curses.ACS_HLINE,
-                    line["length"] - diff_deduction_x,
-                )
-            else:
-                if (
-                    normalized_x < 0
-                    or normalized_y < 0
-                    or normalized_x >= win.getmaxyx()[1]
-                    or normalized_y >= win.getmaxyx()[0]
-                ):
-                    continue
-                win.addch(
-                    get_safe_y(win, normalized_y),
-                    get_safe_x(win, normalized_x),
-                    line["type"],
-                )
+        self._cache_key = key
+        self._cache_lines = line_segments
+        return line_segments
 
     def render(self, stdscr: curses.window, offset: Offset) -> None:
         """
@@ -428,7 +295,7 @@ class Edge:
             stdscr (curses.window): The window to render the edge on.
             offset (Point): The offset to apply to the edge's coordinates.
         """
-        self.connect_nodes(stdscr, offset)
+        EdgeRasterizer(stdscr).rasterize([self], offset)
 
     def to_json(self) -> dict[str, Any]:
         """
@@ -444,12 +311,15 @@ class Edge:
         }
 
     @staticmethod
-    def from_json(data: dict[str:any], nodes: list[Node]) -> "Edge":
+    def from_json(
+        data: dict[str:any], nodes_by_id: dict[str, Node] | list[Node]
+    ) -> "Edge":
         """
         Create an Edge object from a JSON-like dictionary.
         Args:
             data (dict): A dictionary containing the edge data.
-            nodes (list): A list of Node objects to find the source and target nodes.
+            nodes_by_id (dict): Node objects keyed by id, used to find the source
+                and target nodes. A list of Node objects is also accepted.
         Returns:
             Edge: An Edge object created from the provided data.
         Raises:
@@ -469,14 +339,12 @@ class Edge:
             raise ValueError(
                 "Invalid data format. Expected 'id' key in 'source' and 'target'."
             )
-        source_node = next(
-            (node for node in nodes if node.id == data["source"]["id"]), None
-        )
+        if not isinstance(nodes_by_id, dict):
+            nodes_by_id = {node.id: node for node in nodes_by_id}
+        source_node = nodes_by_id.get(data["source"]["id"])
         if source_node is None:
             raise ValueError(f"Node with id {data['source']['id']} not found.")
-        target_node = next(
-            (node for node in nodes if node.id == data["target"]["id"]), None
-        )
+        target_node = nodes_by_id.get(data["target"]["id"])
         if target_node is None:
             raise ValueError(f"Node with id {data['target']['id']} not found.")
         new_edge = Edge(
@@ -485,3 +353,103 @@ class Edge:
             edge_id=data["id"],
         )
         return new_edge
+
+
+class EdgeRasterizer:
+    """
+    EdgeRasterizer draws the line segments for a collection of Edges in a single pass.
+
+    Window bounds are read once per frame and every segment is clipped against
+    them before being handed to curses, so off-screen segments are skipped entirely.
+    Strokes from all edges are then fused, so overlapping or touching lines on the
+    same row or column are drawn with a single curses call. Where lines cross,
+    horizontal lines are drawn over vertical ones and corners over both,
+    regardless of the order of the edges.
+
+    Attributes:
+        window: curses.window to draw in
+    """
+
+    def __init__(self, window: curses.window) -> None:
+        self.window = window
+
+    @staticmethod
+    def _merge_spans(spans: list[Tuple[int, int]]) -> list[Tuple[int, int]]:
+        """
+        Merges overlapping or touching [start, end) spans.
+
+        Args:
+            spans: list of (start, end) tuples along a single row or column
+
+        Returns:
+            Sorted list of disjoint (start, end) tuples
+        """
+        spans.sort()
+        merged = [spans[0]]
+        for start, end in spans[1:]:
+            last_start, last_end = merged[-1]
+            if start <= last_end:
+                if end > last_end:
+                    merged[-1] = (last_start, end)
+            else:
+                merged.append((start, end))
+        return merged
+
+    def rasterize(self, edges: list[Edge], offset: Offset) -> None:
+        """
+        Renders terminal updates for every provided Edge.
+
+        Args:
+            edges: list of Edge objects to draw
+            offset: Offset for terminal
+        """
+        max_y, max_x = self.window.getmaxyx()
+        offset_x, offset_y = offset.x, offset.y
+
+        # Clipped spans keyed by the column (vertical) or row (horizontal) they sit on
+        columns: dict[int, list[Tuple[int, int]]] = {}
+        rows: dict[int, list[Tuple[int, int]]] = {}
+        corners: dict[Tuple[int, int], int] = {}
+
+        for edge in edges:
+            for seg_type, x, y, length in edge.get_line_breakdown():
+                normalized_x = x - offset_x
+                normalized_y = y - offset_y
+
+                if seg_type == _SEG_V:
+                    if normalized_x < 0 or normalized_x >= max_x:
+                        continue
+                    start = 0 if normalized_y < 0 else normalized_y
+                    end = normalized_y + length
+                    if end > max_y:
+                        end = max_y
+                    if end > start:
+                        columns.setdefault(normalized_x, []).append((start, end))
+                elif seg_type == _SEG_H:
+                    if normalized_y < 0 or normalized_y >= max_y:
+                        continue
+                    start = 0 if normalized_x < 0 else normalized_x
+                    end = normalized_x + length
+                    if end > max_x:
+                        end = max_x
+                    if end > start:
+                        rows.setdefault(normalized_y, []).append((start, end))
+                elif 0 <= normalized_x < max_x and 0 <= normalized_y < max_y:
+                    corners[(normalized_y, normalized_x)] = seg_type
+
+        # ACS_* values only exist once curses is initialized, so they are bound
+        # per frame rather than at import time
+        vline, hline, addch = self.window.vline, self.window.hline, self.window.addch
+        acs_vline, acs_hline = curses.ACS_VLINE, curses.ACS_HLINE
+
+        # Verticals go first, so a horizontal line wins wherever two lines cross
+        for x, spans in columns.items():
+            for start, end in self._merge_spans(spans):
+                vline(start, x, acs_vline, end - start)
+        for y, spans in rows.items():
+            for start, end in self._merge_spans(spans):
+                hline(y, start, acs_hline, end - start)
+
+        # Corners are drawn last so they sit on top of the lines they join
+        for (y, x), corner in corners.items():
+            addch(y, x, corner)
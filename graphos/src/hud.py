@@ -7,6 +7,10 @@ class Hud:
     def __init__(self, window: curses.window, cursor: Cursor, offset: Offset):
         window_height, window_width = window.getmaxyx()
         self.assess_window(window_width, window_height, cursor, offset)
+        self._last_key = None
+        self._last_str = ""
+        self._fmt = " pan: ([%d,%d], [%d, %d]) cursor: (%d/%d, %d/%d) "
+        self._grab_fmt = " pan: ([%d,%d], [%d, %d]) "
 
     def assess_window(
         self, window_width, window_height, cursor: Cursor, offset: Offset
@@ -16,16 +20,44 @@ class Hud:
         self.cursor = cursor
         self.offset = offset
 
+    def build_hud_string(self):
+        # hud_string = f" x: [{0 + self.offset.x} : {self.cursor.x} : {self.window_width + self.offset.x }], y: [{0 + self.offset.y} : {self.cursor.y} : {self.window_height + self.offset.y }] "
+        # Only the pan position is shown while grabbing
+        if self.cursor.grab:
+            return self._grab_fmt % (
+                self.offset.x,
+                self.window_width + self.offset.x,
+                self.offset.y,
+                self.window_height + self.offset.y,
+            )
+        return self._fmt % (
+            self.offset.x,
+            self.window_width + self.offset.x,
+            self.offset.y,
+            self.window_height + self.offset.y,
+            self.cursor.x,
+            self.window_width,
+            self.cursor.y,
+            self.window_height,
+        )
+
     def render(self, window: curses.window):
 
-        pan_string = f"pan: ([{0 + self.offset.x},{self.window_width + self.offset.x }], [{0 + self.offset.y}, {self.window_height + self.offset.y}])"
-        cursor_string = f"cursor: ({self.cursor.x}/{self.window_width}, {self.cursor.y}/{self.window_height})"
-        if self.cursor.grab:
-            hud_string = f" {pan_string} "
-        else:
-            hud_string = f" {cursor_string} "
-        hud_string = f" {pan_string} {cursor_string} "
-        # hud_string = f" x: [{0 + self.offset.x} : {self.cursor.x} : {self.window_width + self.offset.x }], y: [{0 + self.offset.y} : {self.cursor.y} : {self.window_height + self.offset.y }] "
+        # The window is cleared every frame, so the string is always drawn,
+        # but only rebuilt when one of its inputs changed
+        key = (
+            self.cursor.x,
+            self.cursor.y,
+            self.offset.x,
+            self.offset.y,
+            self.window_width,
+            self.window_height,
+            self.cursor.grab,
+        )
+        if key != self._last_key:
+            self._last_key = key
+            self._last_str = self.build_hud_string()
+        hud_string = self._last_str
 
         window.addstr(
             self.window_height - 1,
@@ -43,12 +43,15 @@ def main(window: window) -> None:
 
     Args: stdscr: window object for interfacing with terminal
     """
+    setup_logging()
     args = setup_args()
     view = View(window, args)
     view.loop()
 
 
-wrapper(main)
+def run() -> None:
+    """Entrypoint for the installed console script"""
+    wrapper(main)
 
 
 if __name__ == "__main__":
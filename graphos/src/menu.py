@@ -5,18 +5,12 @@ This includes the frame, as well as HUD information and coordinate locations.
 """
 
 import curses
-from curses.textpad import rectangle
 import logging
-from graphos.src.constants import LOG_OUTPUT
-from graphos.src.utils import clear_section
 
-logger = logging.getLogger(__name__)
+from graphos.src.cursor import Cursor
+from graphos.src.offset import Offset
 
-logging.basicConfig(
-    filename=LOG_OUTPUT,
-    level=logging.DEBUG,
-    format="%(levelname)s - %(message)s",
-)
+logger = logging.getLogger(__name__)
 
 
 class Menu:
@@ -30,10 +24,25 @@ class Menu:
         x: int current x coordinate
         y: int current y coordinate
         dimensions: dict boundary coordinates for menu
-        option_dimensions: list dict object containing coordinate sizes of each option
+        pane: curses.window the menu is drawn into, kept on top of window
         selected_option: indicates current user selected option based on cursor location
     """
 
+    __slots__ = (
+        "options",
+        "width",
+        "window",
+        "x",
+        "y",
+        "dimensions",
+        "pane",
+        "selected_option",
+        "_dirty",
+        "_cursor_cells",
+        "_default_color",
+        "_selected_color",
+    )
+
     def __init__(self, options: list[str], x: int, y: int, window: curses.window):
         self.options = options
         self.width = max(len(option) for option in options) + 4
@@ -47,31 +56,44 @@ class Menu:
             "lry": self.y + len(self.options) + 1,
             "lrx": self.x + self.width,
         }
-        self.options_dimensions = []
-        for i in range(len(options)):
-            self.options_dimensions.append(
-                {
-                    "uly": self.y + i + 1,
-                    "ulx": self.x + 2,
-                    "lry": self.y + i + 2,
-                    "lrx": self.x + self.width - 2,
-                }
-            )
+        self.pane = self._create_pane()
         self.selected_option = -1
+        self._dirty = True
+        self._cursor_cells = ()
+        self._default_color = curses.color_pair(4)
+        self._selected_color = curses.color_pair(5)
 
     def correct_dimensions(self) -> None:
         """
         Sanitizes coordinates to be within window.
         Sets x and y attributes.
         """
-        if self.y <= 0:
-            self.y = 1
-        if self.x <= 0:
-            self.x = 1
-        if self.y + len(self.options) + 2 > self.window.getmaxyx()[0]:
-            self.y = self.window.getmaxyx()[0] - len(self.options) - 2
-        if self.x + self.width > self.window.getmaxyx()[1]:
-            self.x = self.window.getmaxyx()[1] - self.width - 2
+        max_y, max_x = self.window.getmaxyx()
+        self.y = min(max(self.y, 1), max_y - len(self.options) - 2)
+        self.x = max(self.x, 1)
+        if self.x + self.width > max_x:
+            self.x = max_x - self.width - 2
+
+    def _create_pane(self) -> curses.window | None:
+        """
+        Creates the window the menu is drawn into.
+        The pane keeps its contents between frames, so it only needs to be
+        redrawn when the menu changes.
+
+        Returns:
+            curses.window for the menu, or None if it does not fit the screen
+        """
+        max_x = self.window.getmaxyx()[1]
+        try:
+            return curses.newwin(
+                len(self.options) + 2,
+                min(self.width + 1, max_x - self.x),
+                self.y,
+                self.x,
+            )
+        except curses.error:
+            logger.error("Error creating menu pane.")
+            return None
 
     def assess_position(self, x: int, y: int) -> None:
         """
@@ -83,15 +105,10 @@ class Menu:
             y: int y coordinate
         """
         # Keep track of which option is highlighted
-        for i, dimensions in enumerate(self.options_dimensions):
-            if (
-                dimensions["uly"] <= y < dimensions["lry"]
-                and dimensions["ulx"] <= x < dimensions["lrx"]
-            ):
-                self.selected_option = i
-                break
-        else:
-            self.selected_option = -1
+        selected_option = self.get_clicked_option(x, y)
+        if selected_option != self.selected_option:
+            self.selected_option = selected_option
+            self._dirty = True
 
     def is_focused(self, x: int, y: int) -> bool:
         """
@@ -109,44 +126,86 @@ class Menu:
     def get_clicked_option(self, x: int, y: int) -> int:
         """
         Get the clicked option based on mouse event coordinates.
+        Options are drawn one per row below the top border, so the index
+        is derived directly from the row.
         
         Args:
             x: int x coordinate
             y: int y coordinate
         """
-        for i, dimensions in enumerate(self.options_dimensions):
-            if (
-                dimensions["uly"] <= y < dimensions["lry"]
-                and dimensions["ulx"] <= x < dimensions["lrx"]
-            ):
-                return i
+        i = y - self.y - 1
+        if 0 <= i < len(self.options) and self.x + 2 <= x < self.x + self.width - 2:
+            return i
         return -1
 
     def render(self) -> None:
         """
         Draws the menu content in the terminal.
+        The pane is only redrawn when the highlighted option changed, but is
+        staged on top of the window every frame since the window is redrawn underneath.
         """
-        clear_section(self.window, **self.dimensions)
-        try:
-            rectangle(self.window, **self.dimensions)
-        except curses.error:
-            logger.error("Error drawing rectangle in menu.")
-
-        default_color = curses.color_pair(4)
-        selected_color = curses.color_pair(5)
-        for i, option in enumerate(self.options):
-            if i == self.selected_option:
-                self.window.attron(selected_color)
-            else:
-                self.window.attron(default_color)
-            self.window.addstr(
-                self.y + i + 1,
-                self.x + 2,
-                option,
+        if self.pane is None:
+            return
+
+        if self._dirty:
+            # The full redraw also covers any cells under the cursor glyph
+            self._cursor_cells = ()
+            self.pane.erase()
+            self.pane.box()
+
+            self.pane.attron(self._default_color)
+            for i, option in enumerate(self.options):
+                if i != self.selected_option:
+                    self.pane.addstr(i + 1, 2, option)
+            self.pane.attroff(self._default_color)
+            if self.selected_option != -1:
+                self.pane.attron(self._selected_color)
+                self.pane.addstr(
+                    self.selected_option + 1, 2, self.options[self.selected_option]
+                )
+                self.pane.attroff(self._selected_color)
+            self._dirty = False
+
+        self.pane.touchwin()
+        self.pane.noutrefresh()
+
+    def render_cursor(self, cursor: Cursor, offset: Offset) -> None:
+        """
+        Draws the cursor on top of the pane when it is over the menu.
+        The cells under the glyph are kept and written back on the next frame, so
+        the pane does not need a full redraw once the cursor moves on.
+
+        Args:
+            cursor: Cursor to draw
+            offset: Offset calculator for rendering
+        """
+        if self.pane is None:
+            return
+
+        changed = bool(self._cursor_cells)
+        for y, x, cell in self._cursor_cells:
+            try:
+                self.pane.addch(y, x, cell)
+            except curses.error:
+                # Writing the bottom right cell fails once the character is placed
+                pass
+        self._cursor_cells = ()
+
+        symbol = cursor.grab_symbol if cursor.grab else cursor.symbol
+        # Test against the pane itself, which also covers the border cells
+        begin_y, begin_x = self.pane.getbegyx()
+        max_y, max_x = self.pane.getmaxyx()
+        y, x = cursor.y - begin_y, cursor.x - begin_x
+        if symbol and 0 <= y < max_y and 0 <= x < max_x:
+            # The grab symbol is two cells wide
+            self._cursor_cells = tuple(
+                (y, i, self.pane.inch(y, i)) for i in range(x, min(x + 2, max_x))
             )
-            self.window.refresh()
-            if i == self.selected_option:
-                self.window.attroff(selected_color)
-            else:
-                self.window.attroff(default_color)
-        self.window.refresh()
+            try:
+                cursor.render(self.pane, offset)
+            except curses.error:
+                pass
+            changed = True
+
+        if changed:
+            self.pane.noutrefresh()
@@ -6,10 +6,9 @@ Contains the Modal class, and required functions for building new objects.
 
 # pylint: disable=E1101
 import curses
-from curses.textpad import Textbox, rectangle
 
 from graphos.src.constants import Ascii
-from graphos.src.utils import clear_section
+from graphos.src.utils import clear_section, flush
 
 
 class Modal:
@@ -26,46 +25,62 @@ class Modal:
         y: int y coordinate for modal location
     """
 
+    __slots__ = (
+        "window",
+        "title",
+        "content",
+        "width",
+        "height",
+        "x",
+        "y",
+    )
+
     def __init__(self, window: curses.window, title: str, content: str = "") -> None:
         self.window = window
         self.title = title
         self.content = content
-        self.width = max(len(title) + 4, len(content.split("\n")[0]) + 4)
-        self.height = len(content.split("\n")) + 4
+        # Only the line count and the first line are needed, no need to split
+        first_line_end = content.find("\n")
+        if first_line_end == -1:
+            first_line_end = len(content)
+        self.width = max(len(title) + 4, first_line_end + 4)
+        self.height = content.count("\n") + 1 + 4
         self.x = (curses.COLS - self.width) // 2
         self.y = (curses.LINES - self.height) // 2
 
     def render_border(self) -> None:
         """
         Draws the border for the provided modal.
+        The window is not refreshed, that is left to the caller.
         """
         self.window.attron(curses.color_pair(4))
         clear_section(
             self.window, self.y, self.x, self.y + self.height, self.x + self.width
         )
-        rectangle(
-            self.window,
-            self.y,
-            self.x,
-            self.y + self.height,
-            self.x + self.width,
-        )
-        self.window.addch(self.y, self.x, Ascii.ROUND_UL_CORNDER)
-        self.window.addch(self.y + self.height, self.x, Ascii.ROUND_LL_CORNER)
-        self.window.addch(self.y, self.x + self.width, Ascii.ROUND_UR_CORNER)
-        self.window.addch(
-            self.y + self.height, self.x + self.width, Ascii.ROUND_LR_CORNER
+        horizontal = Ascii.HORIZONTAL_LINE * (self.width - 1)
+        top = Ascii.ROUND_UL_CORNDER + horizontal + Ascii.ROUND_UR_CORNER
+        bottom = Ascii.ROUND_LL_CORNER + horizontal + Ascii.ROUND_LR_CORNER
+        self.window.addstr(self.y, self.x, top)
+        self.window.addstr(self.y + self.height, self.x, bottom)
+        self.window.vline(self.y + 1, self.x, curses.ACS_VLINE, self.height - 1)
+        self.window.vline(
+            self.y + 1, self.x + self.width, curses.ACS_VLINE, self.height - 1
         )
-        self.window.refresh()
         self.window.attroff(curses.color_pair(4))
 
     def render(self) -> None:
         """
         Renders the Modal.
+        The modal is flushed to the terminal before input is read, Textbox.edit()
+        then refreshes the edit window synchronously on every keypress.
         """
+        # Deferred so that curses.textpad is only loaded once a modal is opened
+        from curses.textpad import Textbox  # pylint: disable=C0415
+
         self.render_border()
         self.window.addstr(self.y + 1, self.x + 2, self.title)
-        self.window.refresh()
+        self.window.noutrefresh()
+        flush()
         editwin = self.window.subwin(1, self.width - 5, self.y + 3, self.x + 3)
         box = Textbox(editwin)
         box.edit()
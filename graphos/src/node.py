@@ -1,8 +1,7 @@
 import curses
-from curses.textpad import rectangle
 import uuid
 
-from graphos.src.utils import clear_section, get_safe_x, get_safe_y
+from graphos.src.utils import clear_section, draw_rectangle, get_safe_xy
 
 
 class Node:
@@ -101,10 +100,8 @@ class Node:
         normalized_y_end = self.y + self.height - offset.y
         normalized_x_end = self.x + self.width - offset.x
 
-        uly = get_safe_y(stdscr, normalized_y)
-        ulx = get_safe_x(stdscr, normalized_x)
-        lry = get_safe_y(stdscr, normalized_y_end)
-        lrx = get_safe_x(stdscr, normalized_x_end)
+        ulx, uly = get_safe_xy(stdscr, normalized_x, normalized_y, max_y, max_x)
+        lrx, lry = get_safe_xy(stdscr, normalized_x_end, normalized_y_end, max_y, max_x)
 
         if ulx == lrx or uly == lry:
             return
@@ -118,37 +115,31 @@ class Node:
                 lry,
                 lrx,
             )
-            rectangle(stdscr, uly, ulx, lry, lrx)
+            draw_rectangle(stdscr, uly, ulx, lry, lrx)
         except curses.error:
             # TODO: Debug why this is causing errors. Reproduced when panning a collection of noded down and to the right
             # Handle the case where rectangle goes out of bounds
             pass
 
         # Draw edge connectors
+        normalized_center_x = self.center[0] - offset.x
+        normalized_center_y = self.center[1] - offset.y
         if self.bottom_edge and normalized_y_end < max_y and self.center[0] < max_x:
-            stdscr.addch(
-                get_safe_y(stdscr, normalized_y_end),
-                get_safe_x(stdscr, self.center[0] - offset.x),
-                curses.ACS_TTEE,
+            x, y = get_safe_xy(
+                stdscr, normalized_center_x, normalized_y_end, max_y, max_x
             )
+            stdscr.addch(y, x, curses.ACS_TTEE)
         if self.top_edge and normalized_y > 0 and self.center[0] < max_x:
-            stdscr.addch(
-                get_safe_y(stdscr, normalized_y),
-                get_safe_x(stdscr, self.center[0] - offset.x),
-                curses.ACS_BTEE,
-            )
+            x, y = get_safe_xy(stdscr, normalized_center_x, normalized_y, max_y, max_x)
+            stdscr.addch(y, x, curses.ACS_BTEE)
         if self.left_edge and normalized_x > 0 and self.center[1] < max_y:
-            stdscr.addch(
-                get_safe_y(stdscr, self.center[1] - offset.y),
-                get_safe_x(stdscr, normalized_x),
-                curses.ACS_RTEE,
-            )
+            x, y = get_safe_xy(stdscr, normalized_x, normalized_center_y, max_y, max_x)
+            stdscr.addch(y, x, curses.ACS_RTEE)
         if self.right_edge and normalized_x_end < max_x and self.center[1] < max_y:
-            stdscr.addch(
-                get_safe_y(stdscr, self.center[1] - offset.y),
-                get_safe_x(stdscr, normalized_x_end),
-                curses.ACS_LTEE,
+            x, y = get_safe_xy(
+                stdscr, normalized_x_end, normalized_center_y, max_y, max_x
             )
+            stdscr.addch(y, x, curses.ACS_LTEE)
 
         stdscr.attroff(curses.color_pair(color))
 
@@ -5,7 +5,7 @@ Offset module is used to help calculate the offset of rendered items when pannin
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Offset:
     """
     Offset object contains the x and y coordinate offset definitions to track panning movements.
@@ -15,6 +15,5 @@ class Offset:
         y: int y coordinate
     """
 
-    def __init__(self, x: int = 0, y: int = 0) -> None:
-        self.x = x
-        self.y = y
+    x: int = 0
+    y: int = 0
@@ -14,17 +14,12 @@ def get_safe_x(
 
     Args:
         stdscr: curses.window for interacting with
-        y: int current y coordinate
+        x: int current x coordinate
 
     Returns:
         int coordinate for x
     """
-    max_x = stdscr.getmaxyx()[1]
-    if x < 0:
-        return 0
-    if x >= max_x:
-        return max_x - 1
-    return x
+    return min(max(x, 0), stdscr.getmaxyx()[1] - 1)
 
 
 def get_safe_y(
@@ -39,27 +34,87 @@ def get_safe_y(
         y: int current y coordinate
 
     Returns:
-        int coordinate for x
+        int coordinate for y
+    """
+    return min(max(y, 0), stdscr.getmaxyx()[0] - 1)
+
+
+def get_safe_xy(
+    stdscr: curses.window,
+    x: int,
+    y: int,
+    max_y: int | None = None,
+    max_x: int | None = None,
+) -> tuple[int, int]:
+    """
+    Get safe x and y coordinates for rendering within the window bounds.
+    Callers that already know the window size can pass it to skip the lookup.
+
+    Args:
+        stdscr: curses.window for interacting with
+        x: int current x coordinate
+        y: int current y coordinate
+        max_y: int optional cached window height
+        max_x: int optional cached window width
+
+    Returns:
+        tuple of int coordinates for x and y
     """
-    max_y = stdscr.getmaxyx()[0]
-    if y < 0:
-        return 0
-    if y >= max_y:
-        return max_y - 1
-    return y
+    if max_y is None or max_x is None:
+        max_y, max_x = stdscr.getmaxyx()
+    return min(max(x, 0), max_x - 1), min(max(y, 0), max_y - 1)
 
 
 def clear_section(window, uly: int, ulx: int, lry: int, lrx: int) -> None:
     """
-    Clears out the section between the boundary provided.
+    Clears out the section between the boundary provided, clipped to the window.
+    The window is not refreshed, that is left to the caller.
 
     Args:
+        window: curses.window to clear
         uly: int upper left vertical coordinate
         ulx: int upper left horizontal coordinate
         lry: int lower right vertical coordinate
         lrx: int lower right horizontal coordinate
     """
+    max_y, max_x = window.getmaxyx()
+    uly, lry = max(uly, 0), min(lry, max_y)
+    ulx, lrx = max(ulx, 0), min(lrx, max_x)
+    if ulx >= lrx:
+        return
+
+    blank = " " * (lrx - ulx)
+    addstr = window.addstr
     for y in range(uly, lry):
-        for x in range(ulx, lrx):
-            window.addch(get_safe_y(window, y), get_safe_x(window, x), " ")
-    window.refresh()
+        addstr(y, ulx, blank)
+
+
+def draw_rectangle(window, uly: int, ulx: int, lry: int, lrx: int) -> None:
+    """
+    Draws a box with corners at the provided upper left and lower right coordinates.
+    Same output as curses.textpad.rectangle, kept here so that drawing nodes does
+    not load curses.textpad.
+
+    Args:
+        window: curses.window to draw in
+        uly: int upper left vertical coordinate
+        ulx: int upper left horizontal coordinate
+        lry: int lower right vertical coordinate
+        lrx: int lower right horizontal coordinate
+    """
+    window.vline(uly + 1, ulx, curses.ACS_VLINE, lry - uly - 1)
+    window.hline(uly, ulx + 1, curses.ACS_HLINE, lrx - ulx - 1)
+    window.hline(lry, ulx + 1, curses.ACS_HLINE, lrx - ulx - 1)
+    window.vline(uly + 1, lrx, curses.ACS_VLINE, lry - uly - 1)
+    window.addch(uly, ulx, curses.ACS_ULCORNER)
+    window.addch(uly, lrx, curses.ACS_URCORNER)
+    window.addch(lry, lrx, curses.ACS_LRCORNER)
+    window.addch(lry, ulx, curses.ACS_LLCORNER)
+
+
+def flush() -> None:
+    """
+    Writes every window staged with noutrefresh() to the terminal in one update.
+    Intended to be called once at the end of a frame.
+    """
+    curses.doupdate()
@@ -3,23 +3,18 @@ import json
 import logging
 from pathlib import Path
 
-from graphos.src.constants import LOG_OUTPUT, MOUSE_OUTPUT, SAVE_OUTPUT
+from graphos.src.constants import MOUSE_OUTPUT, SAVE_OUTPUT
 from graphos.src.cursor import Cursor
-from graphos.src.edge import Edge
+from graphos.src.edge import Edge, EdgeRasterizer
 from graphos.src.hud import Hud
 from graphos.src.menu import Menu
 from graphos.src.modal import Modal
 from graphos.src.node import Node
 from graphos.src.offset import Offset
+from graphos.src.utils import flush
 
 logger = logging.getLogger(__name__)
 
-logging.basicConfig(
-    filename=LOG_OUTPUT,
-    level=logging.DEBUG,
-    format="%(levelname)s - %(message)s",
-)
-
 
 class View:
     def __init__(self, window: curses.window, args: dict[str:str]) -> None:
@@ -53,6 +48,7 @@ class View:
         self.menu = None
         self.cursor = Cursor(window_width // 2, window_height // 2, self.args)
         self.hud = Hud(self.window, self.cursor, self.offset)
+        self.edge_rasterizer = EdgeRasterizer(self.window)
 
     def select_node(self, node: Node) -> None:
         if node in self.selected_nodes:
@@ -105,15 +101,15 @@ class View:
 
     def render(self):
 
-        # # Clear the window
-        self.window.clear()
+        # Clear the window contents, erase() lets flush() diff against the
+        # previous frame where clear() would force a full repaint
+        self.window.erase()
 
         # Update nodes of cursor state
         for node in self.nodes:
             node.assess_position(self.cursor, self.offset)
 
-        for edge in self.edges:
-            edge.render(self.window, self.offset)
+        self.edge_rasterizer.rasterize(self.edges, self.offset)
 
         for node in self.nodes:
             if not node.focused:
@@ -186,17 +182,21 @@ class View:
         )
         self.hud.render(self.window)
 
-        # Draw menu
+        # Draw cursor
+        self.cursor.assess_position(self.window, self.offset)
+        self.cursor.render(self.window, self.offset)
+        self.window.noutrefresh()
+
+        # Draw menu on top of the window
         # self.menu.x = self.cursor.x
         # self.menu.y = self.cursor.y
         if self.menu is not None:
             self.menu.assess_position(self.cursor.x, self.cursor.y)
             self.menu.render()
+            # The menu pane is staged over the window, redraw the cursor on top
+            self.menu.render_cursor(self.cursor, self.offset)
 
-        # Draw cursor
-        self.cursor.assess_position(self.window, self.offset)
-        self.cursor.render(self.window, self.offset)
-        self.window.refresh()
+        flush()
 
     def move_cursor_up(self):
         if self.cursor.y > 1:
@@ -252,9 +252,10 @@ class View:
                 loaded_nodes = []
                 for node in state["nodes"]:
                     loaded_nodes.append(Node.from_json(node))
+                nodes_by_id = {node.id: node for node in loaded_nodes}
                 loaded_edges = []
                 for edge in state["edges"]:
-                    loaded_edges.append(Edge.from_json(edge, loaded_nodes))
+                    loaded_edges.append(Edge.from_json(edge, nodes_by_id))
         except FileNotFoundError:
             logger.debug(f"State file {SAVE_OUTPUT} not found.")
         except json.JSONDecodeError: